@@ -1,7 +1,7 @@
 from constants import COLOR_BLUE, COLOR_GREEN, COLOR_YELLOW, COLOR_RED, COLOR_CYAN, COLOR_RESET
 from constants import STYLE_BOLD, STYLE_DIM
 from init import DEFAULT_DATA_FOLDER_ROOT, ENTRY_FILENAME
-from data_managment import parse_markdown_entry, load_entries, save_entry_metadata
+from data_managment import parse_markdown_entry, save_entry_metadata, normalize_timestamp, insert_entry
 from utility import format_timestamp, open_folder_in_explorer
 from datetime import datetime
 import os
@@ -119,7 +119,10 @@ def open_in_editor(file_path):
 
 
 def edit_markdown(choice_index, entries_list):
-    """Open the entry's markdown in an external editor; re-parse and normalize after editing."""
+    """
+    Open the entry's markdown in an external editor; re-parse and normalize after editing.
+    Returns the updated entry, or False if nothing was edited.
+    """
     if 0 <= choice_index < len(entries_list):
         entry = entries_list[choice_index]
         md_path = os.path.join(entry['data_folder'], ENTRY_FILENAME)
@@ -130,12 +133,13 @@ def edit_markdown(choice_index, entries_list):
             with open(md_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             metadata, description = parse_markdown_entry(content)
-            # Preserve data_folder; keep timestamp as-is
+            # Preserve data_folder; store the timestamp in canonical form
             metadata['data_folder'] = entry['data_folder']
             metadata['description'] = description
+            normalize_timestamp(metadata)
             save_entry_metadata(metadata, description)
             print(f"{COLOR_GREEN}Markdown updated and metadata normalized.{COLOR_RESET}")
-            return True
+            return metadata
         return False
     print(f"{COLOR_RED}[Error] Invalid number. Please enter a number shown in the 'list' output.{COLOR_RESET}")
     return False
@@ -196,7 +200,7 @@ def edit_entry(choice_index, entries_list):
 
 
 def create_entry(entries):
-    """Prompts the user for details and adds a new entry to the list."""
+    """Prompts the user for details and adds a new entry to the list. Returns the new entry, or None if it could not be saved."""
     print(f"\n{COLOR_BLUE}--- Creating New Logbook Entry ---{COLOR_RESET}")
 
     # 1. Title (Required)
@@ -235,14 +239,17 @@ def create_entry(entries):
     }
 
     # 5. Save metadata/markdown body
-    save_entry_metadata(new_entry, description)
-    
-    # Reload from disk to update the in-memory list
-    entries.clear()
-    entries.extend(load_entries())
+    if not save_entry_metadata(new_entry, description):
+        return None
+
+    # Add to the in-memory list, keeping the chronological order
+    new_entry['description'] = description.strip()
+    insert_entry(entries, new_entry)
+    return new_entry
 
 
 def filter_entries(entries, field, value):
+    """Returns the entries whose field contains value (case-insensitive); list fields match on any item."""
     value = value.lower()
     active = []
 
@@ -250,13 +257,10 @@ def filter_entries(entries, field, value):
         ans = e.get(field, "")
 
         if isinstance(ans, str):
-            print(ans, value, value.lower() in ans.lower())
             if value in ans.lower():
                 active.append(e)
 
-
         elif isinstance(ans, list):
-            print(ans, value, value in ans)
             if any(value in item.lower() for item in ans if isinstance(item, str)):
                 active.append(e)
 
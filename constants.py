@@ -34,4 +34,7 @@ COLOR_RESET = '\033[0m'
 
 
 # --- CONFIGURATION ---
-FRONT_MATTER_DELIMITER = '---'
\ No newline at end of file
+FRONT_MATTER_DELIMITER = '---'
+FILTER_CACHE_SIZE = 64  # Max number of filter results kept in memory
+FUZZY_MIN_SCORE = 0.5  # Min fraction of the (rarity-weighted) query trigrams an entry must contain to match 'find'
+FUZZY_MAX_RESULTS = 20  # Max number of entries shown by 'find'
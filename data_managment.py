@@ -1,6 +1,8 @@
 from constants import ( COLOR_GREEN, COLOR_YELLOW, COLOR_RED, COLOR_RESET, FRONT_MATTER_DELIMITER)
+from utility import parse_timestamp
 import yaml
 import os
+import bisect
 from datetime import datetime
 from init import DEFAULT_DATA_FOLDER_ROOT, ENTRY_FILENAME
 
@@ -57,7 +59,7 @@ def load_entries():
                 metadata, description = parse_markdown_entry(content)
 
                 if "title" in metadata and "timestamp" in metadata:
-                    entry = metadata
+                    entry = normalize_timestamp(metadata)
                     entry["description"] = description
                     entry["data_folder"] = entry_folder_path
                     entries.append(entry)
@@ -74,17 +76,57 @@ def load_entries():
         # If ENTRY_FILENAME is NOT in filenames, os.walk will continue into subdirectories
         # defined in dirnames
 
-    entries.sort(key=lambda x: x.get("timestamp", datetime.min) if type(x.get("timestamp", datetime.min)) is datetime else datetime.min, reverse=True)
+    entries.sort(key=timestamp_key, reverse=True)
     return entries
 
 
+def normalize_timestamp(entry):
+    """Replaces the entry's timestamp with its parsed datetime. Unparseable timestamps are left as they are."""
+    parsed = parse_timestamp(entry.get("timestamp"))
+    if parsed is not None:
+        entry["timestamp"] = parsed
+    return entry
+
+
+def timestamp_key(entry):
+    """Sort key of an entry: its timestamp, or datetime.min if it is not a (normalized) datetime."""
+    ts = entry.get("timestamp")
+    return ts if isinstance(ts, datetime) else datetime.min
+
+
+def _newest_first_key(entry):
+    return datetime.max - timestamp_key(entry)
+
+
+def insert_entry(entries, entry):
+    """Inserts entry into the newest-first entries list, keeping it sorted."""
+    bisect.insort_right(entries, entry, key=_newest_first_key)
+
+
+def remove_entry(entries, entry):
+    """Removes entry (matched by identity) from the newest-first entries list. Returns False if it is not there."""
+    index = bisect.bisect_left(entries, _newest_first_key(entry), key=_newest_first_key)
+    while index < len(entries) and _newest_first_key(entries[index]) == _newest_first_key(entry):
+        if entries[index] is entry:
+            del entries[index]
+            return True
+        index += 1
+    return False
+
+
+def replace_entry(entries, old_entry, new_entry):
+    """Replaces old_entry (matched by identity) with new_entry, moving it if its timestamp changed."""
+    remove_entry(entries, old_entry)
+    insert_entry(entries, new_entry)
+
+
 def save_entry_metadata(entry, description_body):
-    """Saves the entry's metadata and description body into its entry_filename file."""
+    """Saves the entry's metadata and description body into its entry_filename file. Returns True on success."""
     if "data_folder" not in entry:
         print(
             f"{COLOR_RED}[Error] Cannot save entry: missing 'data_folder' path.{COLOR_RESET}"
         )
-        return
+        return False
 
     entry_file_path = os.path.join(entry["data_folder"], ENTRY_FILENAME)
 
@@ -105,11 +147,14 @@ def save_entry_metadata(entry, description_body):
             f.write(full_content)
 
         print(f"{COLOR_GREEN}Entry saved to: {entry_file_path}{COLOR_RESET}")
+        return True
     except IOError as e:
         print(
             f"{COLOR_RED}Error writing entry file {entry_file_path}: {e}{COLOR_RESET}"
         )
+        return False
     except Exception as e:
         print(
             f"{COLOR_RED}An unexpected error occurred during saving: {e}{COLOR_RESET}"
         )
+        return False
@@ -0,0 +1,117 @@
+from constants import FILTER_CACHE_SIZE
+from commands import filter_entries
+from data_managment import insert_entry, remove_entry
+from collections import OrderedDict
+
+
+# --- FILTER STATE (undo/redo history and cached results) ---
+
+def normalize_filters(filters):
+    """Returns a hashable, order-independent key for a {field: text} filter dict."""
+    return tuple(sorted((field, value.lower()) for field, value in filters.items()))
+
+
+def _matches(entry, chain):
+    """True if entry passes every (field, text) filter of a normalized chain."""
+    return all(filter_entries([entry], field=field, value=value) for field, value in chain)
+
+
+class FilterState:
+    """
+    Keeps the active search filters, their undo/redo history and an LRU cache of filter results.
+    Results are keyed on the normalized filter set. Any change to the loaded entries must go
+    through update(), which patches only the cached results the changed entry belongs to.
+    """
+
+    def __init__(self, entries, cache_size=FILTER_CACHE_SIZE):
+        self.entries = entries
+        self.filters = dict()
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._undo = []
+        self._redo = []
+
+    def _push_history(self):
+        self._undo.append(dict(self.filters))
+        self._redo.clear()
+
+    def add(self, field, value):
+        """Adds (or replaces) the filter on field."""
+        self._push_history()
+        self.filters[field] = value
+
+    def reset(self):
+        """Clears all filters. Returns False if there was nothing to clear."""
+        if not self.filters:
+            return False
+        self._push_history()
+        self.filters = dict()
+        return True
+
+    def undo(self):
+        """Restores the previous filter set. Returns False if the history is empty."""
+        if not self._undo:
+            return False
+        self._redo.append(self.filters)
+        self.filters = self._undo.pop()
+        return True
+
+    def redo(self):
+        """Re-applies the last undone filter set. Returns False if there is nothing to redo."""
+        if not self._redo:
+            return False
+        self._undo.append(self.filters)
+        self.filters = self._redo.pop()
+        return True
+
+    def update(self, old_entry=None, new_entry=None):
+        """
+        Updates the cached results after an entry was created (old_entry=None), edited or deleted
+        (new_entry=None). Results whose filters match neither entry are left untouched.
+        """
+        for chain, result in self._cache.items():
+            if old_entry is not None and _matches(old_entry, chain):
+                remove_entry(result, old_entry)
+            if new_entry is not None and _matches(new_entry, chain):
+                insert_entry(result, new_entry)
+
+    def _cache_get(self, key):
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key, result):
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def active(self):
+        """
+        Returns the entries matching all active filters.
+        Filters are conjunctive, so the result for a filter set is computed from the longest cached
+        prefix of its normalized key, and every intermediate result is cached along the way.
+        """
+        chain = normalize_filters(self.filters)
+        if not chain:
+            return self.entries
+
+        result = self._cache_get(chain)
+        if result is not None:
+            return result
+
+        start = 0
+        result = self.entries
+        for i in range(len(chain) - 1, 0, -1):
+            cached = self._cache_get(chain[:i])
+            if cached is not None:
+                start, result = i, cached
+                break
+
+        for i in range(start, len(chain)):
+            field, value = chain[i]
+            result = filter_entries(result, field=field, value=value)
+            self._cache_put(chain[:i + 1], result)
+
+        return result
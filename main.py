@@ -1,7 +1,9 @@
 from constants import (COLOR_BLUE,COLOR_GREEN,COLOR_YELLOW,COLOR_RED,COLOR_BRIGHT_BLUE,COLOR_RESET,FRONT_MATTER_DELIMITER,STYLE_BOLD,STYLE_DIM,STYLE_ITALIC)  # noqa: F401
 from commands import (list_entries,view_entry,open_entry_folder,open_in_editor,edit_markdown,edit_entry,create_entry,filter_entries,reset_active)  # noqa: F401
-from data_managment import (parse_markdown_entry,load_entries,save_entry_metadata,)  # noqa: F401
-from utility import print_help, print_help_command
+from data_managment import (parse_markdown_entry,load_entries,save_entry_metadata,replace_entry)  # noqa: F401
+from utility import print_help, print_help_command, parse_date_bound
+from filter_state import FilterState
+from search_index import FuzzyIndex, TimestampIndex
 import traceback
 import sys
 from version import __version__
@@ -9,14 +11,17 @@ from version import __version__
 def main():
 
     entries = load_entries()
-    active = entries
+    state = FilterState(entries)
+    active = state.active()
+    view_label = dict()  # Label of a transient view shown in active (e.g. find results), on top of the filters
+    fuzzy_index = FuzzyIndex(entries)  # Updated on new/edit, for find
+    timeline = TimestampIndex(entries)  # Kept sorted on new/edit, for since/until/between
 
     print(f"{STYLE_BOLD}{COLOR_BRIGHT_BLUE}{' MEASUREMENTS LOGBOOK ':=^80}{COLOR_RESET}")
     print(f"Github repository: {STYLE_ITALIC}https://github.com/andrea-micelli/data-logbook.git{COLOR_RESET}")
     print(f"Current verion: {STYLE_ITALIC}v{__version__}{COLOR_RESET}\n")
 
-    active_filter = dict()
-    list_entries(active, active_filter)  # Initial list display
+    list_entries(active, state.filters)  # Initial list display
 
     print(f"\n{COLOR_YELLOW}Enter 'help' for commands, or 'quit' to exit.{COLOR_RESET}")
 
@@ -39,12 +44,17 @@ def main():
                     break
 
                 case "list" | "ls":  # Lists all measurements
-                    list_entries(active, active_filter)
+                    list_entries(active, {**state.filters, **view_label})
 
                 case "new" | "nw":  # Creates new entry
-                    create_entry(entries)
-                    active = reset_active(entries)
-                    list_entries(active, active_filter)
+                    new_entry = create_entry(entries)
+                    if new_entry:
+                        timeline.insert(new_entry)
+                        fuzzy_index.add(new_entry)
+                        state.update(new_entry=new_entry)
+                    active = state.active()
+                    view_label = dict()
+                    list_entries(active, state.filters)
 
                 case "open" | "op":  # Opens the folder containing the measurements
                     if not args:  # if arg list is empty
@@ -83,12 +93,19 @@ def main():
                         entry_number = int(args[0])
                         if active:
                             index = entry_number - 1
-                            edit_success = edit_markdown(index, active)
-                            if edit_success:
-                                entries.clear()
-                                entries.extend(load_entries())
-                                active = reset_active(entries) # TODO implementare qui un recupero dei filtri invece di un reset
-                                list_entries(active, active_filter)
+                            old_entry = active[index] if 0 <= index < len(active) else None
+                            edited_entry = edit_markdown(index, active)
+                            if edited_entry:
+                                # active may be entries itself: use old_entry, not active[index], from here on
+                                replace_entry(entries, old_entry, edited_entry)
+                                timeline.remove(old_entry)
+                                timeline.insert(edited_entry)
+                                fuzzy_index.remove(old_entry)
+                                fuzzy_index.add(edited_entry)
+                                state.update(old_entry, edited_entry)
+                                active = state.active()  # Keeps the active filters
+                                view_label = dict()
+                                list_entries(active, state.filters)
                         else:
                             print(f"{COLOR_RED}[Error] No entries to edit. Use 'new' to create one.{COLOR_RESET}")
                     except ValueError:
@@ -98,15 +115,78 @@ def main():
                     if len(args) != 2:
                         print("[Error] Correct usage: 'search <field> <text>'")
                         continue
-                    active_filter[args[0]] = args[1]
-                    active = filter_entries(active, field=args[0], value=args[1])
-                    list_entries(active, active_filter)
+                    state.add(args[0], args[1])
+                    active = state.active()
+                    view_label = dict()
+                    list_entries(active, state.filters)
+
+                case "find" | "fd":  # Typo-tolerant search over the active entries
+                    if not args:
+                        print(f"{COLOR_RED}[Error] Usage: find <text>{COLOR_RESET}")
+                        continue
+                    text = " ".join(args)
+                    within = state.active() if state.filters else None
+                    active = [entry for entry, score in fuzzy_index.search(text, within=within)]
+                    view_label = {"find": text}
+                    list_entries(active, {**state.filters, **view_label})
+
+                case "since" | "until":  # Entries recorded after/before a date
+                    if not args:
+                        print(f"{COLOR_RED}[Error] Usage: {command} <date>{COLOR_RESET}")
+                        continue
+                    text = " ".join(args)
+                    bound = parse_date_bound(text, end=(command == "until"))
+                    if bound is None:
+                        print(f"{COLOR_RED}[Error] Could not read date '{text}'. Try e.g. 05-03-2024 or 2024-03-05.{COLOR_RESET}")
+                        continue
+                    within = state.active() if state.filters else None
+                    if command == "since":
+                        active = timeline.since(bound, within=within)
+                    else:
+                        active = timeline.until(bound, within=within)
+                    view_label = {command: text}
+                    list_entries(active, {**state.filters, **view_label})
+
+                case "between":  # Entries recorded between two dates (inclusive)
+                    if "to" in args:  # Dates with a time need 'to' as separator
+                        split = args.index("to")
+                        start_text, end_text = " ".join(args[:split]), " ".join(args[split + 1:])
+                    elif len(args) == 2:
+                        start_text, end_text = args
+                    else:
+                        print(f"{COLOR_RED}[Error] Usage: between <date> <date>  or  between <date> [time] to <date> [time]{COLOR_RESET}")
+                        continue
+                    start = parse_date_bound(start_text)
+                    end = parse_date_bound(end_text, end=True)
+                    if start is None or end is None:
+                        print(f"{COLOR_RED}[Error] Could not read dates '{start_text}' '{end_text}'. Try e.g. 05-03-2024 or 2024-03-05.{COLOR_RESET}")
+                        continue
+                    within = state.active() if state.filters else None
+                    active = timeline.between(start, end, within=within)
+                    view_label = {"between": f"{start_text}..{end_text}"}
+                    list_entries(active, {**state.filters, **view_label})
 
-                    
                 case "reset" | "rst":
-                    active = reset_active(entries)
-                    active_filter = dict()
-                    list_entries(active, active_filter)
+                    state.reset()
+                    active = state.active()
+                    view_label = dict()
+                    list_entries(active, state.filters)
+
+                case "undo" | "ud":  # Restores the previous filter set
+                    if not state.undo():
+                        print(f"{COLOR_YELLOW}[warning]: nothing to undo{COLOR_RESET}")
+                        continue
+                    active = state.active()
+                    view_label = dict()
+                    list_entries(active, state.filters)
+
+                case "redo" | "rd":  # Re-applies the last undone filter set
+                    if not state.redo():
+                        print(f"{COLOR_YELLOW}[warning]: nothing to redo{COLOR_RESET}")
+                        continue
+                    active = state.active()
+                    view_label = dict()
+                    list_entries(active, state.filters)
 
                 case "help" | "hp":
                     if len(args) == 0:
@@ -1,7 +1,7 @@
 from constants import COLOR_GREEN, COLOR_RED, COLOR_RESET
 from init import ENTRY_FILENAME
 import os
-from datetime import datetime
+from datetime import datetime, date, timedelta
 import sys
 import subprocess
 
@@ -51,6 +51,78 @@ def format_timestamp(ts):
     return str(ts)
 
 
+# Hand-typed timestamp formats, tried after ISO 8601 (which covers the yaml.dump output).
+# Day-first formats come first, matching format_timestamp().
+TIMESTAMP_FORMATS = [
+    "%d-%m-%Y %H:%M:%S", "%d-%m-%Y %H:%M", "%d-%m-%Y",
+    "%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y",
+    "%d.%m.%Y %H:%M:%S", "%d.%m.%Y %H:%M", "%d.%m.%Y",
+    "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d",  # Non-padded ISO-like dates, e.g. 2024-3-5
+    "%Y/%m/%d %H:%M:%S", "%Y/%m/%d %H:%M", "%Y/%m/%d",
+    # Without seconds first: strptime accepts single digits, so %H%M%S would read 1430 as 14:03:00
+    "%Y%m%d_%H%M", "%Y%m%d_%H%M%S",  # Same as the entry folder names (quoted in YAML)
+    "%Y%m%d%H%M", "%Y%m%d%H%M%S", "%Y%m%d",  # Unquoted in YAML these load as ints, underscore dropped
+]
+
+
+def _parse_timestamp_text(text):
+    """Parses a timestamp string. Returns (datetime, has_time), or (None, False) if it cannot be parsed."""
+    text = " ".join(text.split())
+    try:
+        # ISO 8601 dates without a time are at most 10 characters (2024-03-05, 20240305)
+        return datetime.fromisoformat(text), len(text) > 10
+    except ValueError:
+        pass
+    for fmt in TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(text, fmt), "%H" in fmt
+        except ValueError:
+            continue
+    return None, False
+
+
+def _to_naive(ts):
+    """Converts a timezone-aware datetime to naive local time."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone().replace(tzinfo=None)
+    return ts
+
+
+def parse_timestamp(ts):
+    """
+    Converts a timestamp (datetime, date, string or YAML int such as 20240305) into a naive datetime.
+    Timezone-aware values are converted to local time. Returns None if ts cannot be parsed.
+    """
+    if isinstance(ts, datetime):
+        parsed = ts
+    elif isinstance(ts, date):
+        return datetime(ts.year, ts.month, ts.day)
+    elif isinstance(ts, int) and not isinstance(ts, bool):
+        parsed, _ = _parse_timestamp_text(str(ts))
+    elif isinstance(ts, str):
+        parsed, _ = _parse_timestamp_text(ts)
+    else:
+        return None
+
+    if parsed is None:
+        return None
+    return _to_naive(parsed)
+
+
+def parse_date_bound(text, end=False):
+    """
+    Parses a date typed as a since/until bound. Returns None if text cannot be parsed.
+    With end=True a bare date (typed without a time) covers the whole day.
+    """
+    bound, has_time = _parse_timestamp_text(text)
+    if bound is None:
+        return None
+    bound = _to_naive(bound)
+    if end and not has_time:
+        bound += timedelta(days=1) - timedelta(microseconds=1)
+    return bound
+
+
 def print_help():
     print( "\n--- Available Commands ---")
     print(f"{COLOR_GREEN}new{COLOR_RESET}                   : Create a new logbook entry (creates folder and {ENTRY_FILENAME}).")
@@ -59,7 +131,12 @@ def print_help():
     print(f"{COLOR_GREEN}open <N>{COLOR_RESET}              : Open the entry's folder in file explorer and select the {ENTRY_FILENAME} file.")
     print(f"{COLOR_GREEN}edit <N>{COLOR_RESET}              : Open the log_entry.md file in the default editor.")
     print(f"{COLOR_GREEN}search <field> <text>{COLOR_RESET} : Add filter.")
+    print(f"{COLOR_GREEN}find <text>{COLOR_RESET}           : Typo-tolerant search, best matches first.")
+    print(f"{COLOR_GREEN}since <date>{COLOR_RESET}          : Show entries recorded on or after the date.")
+    print(f"{COLOR_GREEN}until <date>{COLOR_RESET}          : Show entries recorded on or before the date.")
+    print(f"{COLOR_GREEN}between <date> <date>{COLOR_RESET} : Show entries recorded between the two dates.")
     print(f"{COLOR_GREEN}reset{COLOR_RESET}                 : Reset filters.")
+    print(f"{COLOR_GREEN}undo{COLOR_RESET} / {COLOR_GREEN}redo{COLOR_RESET}           : Step back/forward through the filter history.")
     print(f"{COLOR_GREEN}help <command>                     : Prints instructions on how to use the command.{COLOR_RESET}")
     print(f"{COLOR_GREEN}quit (or exit){COLOR_RESET}        : Exit the application.")
     print( "--------------------------")
@@ -97,10 +174,30 @@ def print_help_command(command):
             print("Add a filter to narrow down entries in list/show operations.")
             print("- <field> is one of the searchable metadata fields (e.g. date, tag, title).")
             print("- <text> is matched against the chosen field (usually case-insensitive).")
+        case 'find':
+            print(f"{COLOR_GREEN}find <text>{COLOR_RESET}")
+            print("Search the active entries for text, tolerating typos and different separators.")
+            print("- Matches title, sample and the other text fields (not the description).")
+            print("- Results are ranked, best match first; e.g. `find raman a12` finds Raman_sampleA12_calib.")
+            print("- Does not add a filter: `list` shows the results until the next search or reset.")
+        case 'since' | 'until' | 'between':
+            print(f"{COLOR_GREEN}since <date>{COLOR_RESET} / {COLOR_GREEN}until <date>{COLOR_RESET} / {COLOR_GREEN}between <date> <date>{COLOR_RESET}")
+            print("Show the active entries recorded in a date range, newest first.")
+            print("- Dates can be written as 05-03-2024, 05/03/2024, 2024-03-05 or 2024-03-05 14:30.")
+            print("- Bounds are inclusive: a date without a time covers the whole day.")
+            print("- With times, separate the two bounds of `between` with `to`, e.g. `between 2024-03-05 14:30 to 2024-03-06`.")
+            print("- Does not add a filter: `list` shows the results until the next search or reset.")
         case 'reset':
             print(f"{COLOR_GREEN}reset{COLOR_RESET}")
             print("Clear all active search filters.")
             print("- After reset, list and show operate on the full set of entries again.")
+            print("- A reset can be reverted with `undo`.")
+        case 'undo' | 'redo':
+            print(f"{COLOR_GREEN}undo{COLOR_RESET} / {COLOR_GREEN}redo{COLOR_RESET}")
+            print("Step back or forward through the history of search filters.")
+            print("- `undo` restores the filters active before the last search or reset.")
+            print("- `redo` re-applies a filter set removed by `undo`.")
+            print("- Previously seen filter combinations are served from memory.")
         case 'quit' | 'exit':
             print(f"{COLOR_GREEN}quit{COLOR_RESET} / {COLOR_GREEN}exit{COLOR_RESET}")
             print("Terminate the application.")